@@ -1,14 +1,37 @@
 import os
+import time
+import argparse
+import hashlib
 import pytest
 import selenium.webdriver.chrome.options
 import selenium.webdriver.firefox.options
 from selenium.webdriver import Firefox, Chrome
+from todo_page import TodoPage
+from latency import LatencyRecorder
+from result_cache import CACHE_KEY, app_fingerprint, support_fingerprint, function_fingerprint
+
+
+# Плагин pytester нужен для тестов кэша результатов, которые запускают pytest внутри теста.
+pytest_plugins = ["pytester"]
 
 
 # Путь к папке с вебдрайверами.
 PATH_TO_WEBDRIVER = os.path.join(os.getcwd(), "webdrivers")
 # Ссылка на TodoMVC.
 URL = "http://todomvc.com/examples/react/"
+# Браузеры, для которых реализованы тесты.
+SUPPORTED_BROWSERS = ("chrome", "firefox")
+
+
+def positive_int(value):
+    """Тип для аргументов командной строки, которые должны быть
+    целым числом не меньше 1.
+    """
+
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1, got {}".format(number))
+    return number
 
 
 def pytest_addoption(parser):
@@ -21,16 +44,75 @@ def pytest_addoption(parser):
     parser.addoption('--headless',
                      action="store_true",
                      help='option to run browser without UI')
+    parser.addoption('--fuzz-steps',
+                     type=int,
+                     default=300,
+                     help='number of random operations in model-based fuzzing')
+    parser.addoption('--fuzz-seed',
+                     type=int,
+                     default=None,
+                     help='seed for model-based fuzzing (random by default)')
+    parser.addoption('--fuzz-batch',
+                     type=positive_int,
+                     default=50,
+                     help='max number of operations sent to browser in one call')
+    parser.addoption('--fuzz-shrink',
+                     type=int,
+                     default=100,
+                     help='max number of reruns while shrinking a failing sequence')
+    parser.addoption('--latency-repeats',
+                     type=positive_int,
+                     default=5,
+                     help='number of measured interactions per action and list size')
+    parser.addoption('--result-cache',
+                     action="store_true",
+                     help='option to skip tests that passed with the same app build, test source and browser')
+    parser.addoption('--force-run',
+                     action="store_true",
+                     help='option to run all tests even if --result-cache is set')
+    parser.addoption('--result-cache-ttl',
+                     type=float,
+                     default=24,
+                     help='how many hours a passed result stays in the result cache')
+    parser.addoption('--load-users',
+                     type=int,
+                     default=0,
+                     help='number of virtual users in load mode (load mode is off by default)')
+    parser.addoption('--load-ramp',
+                     type=float,
+                     default=5,
+                     help='seconds between starting two virtual users in load mode')
+    parser.addoption('--load-duration',
+                     type=float,
+                     default=60,
+                     help='seconds to keep full load after all virtual users are started')
+    parser.addoption('--load-max-error-rate',
+                     type=float,
+                     default=0.01,
+                     help='max allowed share of failed scripts in load mode')
+    parser.addoption('--app-dir',
+                     default=None,
+                     help='path to a local copy of TodoMVC React for load mode')
 
 
-@pytest.fixture(scope="session")
-def browser(request):
-    """Возвращает сгенерированный объект 'браузер'
-    для дальнейшей работы с ним в тестах. А в конце
-    тестовой сессии закрывает его.
+def pytest_configure(config):
+    """Регистрирует метки, используемые в тестах."""
+    config.addinivalue_line("markers",
+                            "load: load test that drives its own browsers against a local copy of the app")
+    config.addinivalue_line("markers",
+                            "no_result_cache: test whose result depends on more than its source "
+                            "(random seed, timings, CLI options) and is never served from the result cache")
+    config.addinivalue_line("markers",
+                            "no_browser: test that does not use the browser or the TodoMVC app")
+
+
+def create_browser(browser_name, headless):
+    """Создает объект 'браузер' с нужными настройками.
+
+    :param browser_name: Название браузера: Chrome или Firefox.
+    :param headless: Флаг для запуска браузера без UI.
+    :return Объект браузера или None, если браузер не поддерживается.
     """
-    # Получаем аргумент с названием браузера.
-    browser_name = request.config.getoption('--browser')
 
     # Если выбран в качестве браузера Chrome:
     if browser_name.lower() == "chrome":
@@ -39,26 +121,40 @@ def browser(request):
         chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
 
         # Если тесты запущены в headless режиме.
-        if request.config.getoption("--headless"):
+        if headless:
             chrome_options.add_argument("--headless")
             chrome_options.add_argument("--disable-gpu")
 
-        driver = Chrome(executable_path=os.path.join(PATH_TO_WEBDRIVER, "chromedriver"), options=chrome_options)
+        return Chrome(executable_path=os.path.join(PATH_TO_WEBDRIVER, "chromedriver"), options=chrome_options)
 
     # Если выбран в качестве браузера Firefox
-    elif browser_name.lower() == "firefox":
+    if browser_name.lower() == "firefox":
         firefox_options = selenium.webdriver.firefox.options.Options()
 
         # Если тесты запущены в headless режиме.
-        if request.config.getoption("--headless"):
+        if headless:
             firefox_options.add_argument("--headless")
             firefox_options.add_argument("--disable-gpu")
 
-        driver = Firefox(executable_path=os.path.join(PATH_TO_WEBDRIVER, "geckodriver"), options=firefox_options,
-                         service_log_path=os.path.devnull)
+        return Firefox(executable_path=os.path.join(PATH_TO_WEBDRIVER, "geckodriver"), options=firefox_options,
+                       service_log_path=os.path.devnull)
+
+    return None
+
+
+@pytest.fixture(scope="session")
+def browser(request):
+    """Возвращает сгенерированный объект 'браузер'
+    для дальнейшей работы с ним в тестах. А в конце
+    тестовой сессии закрывает его.
+    """
+    # Получаем аргумент с названием браузера.
+    browser_name = request.config.getoption('--browser')
+
+    driver = create_browser(browser_name, request.config.getoption("--headless"))
 
     # Если ни один из них, то возвращаем ошибку.
-    else:
+    if driver is None:
         pytest.fail("Tests for browser '{}' are not implemented.".format(browser_name))
         return
 
@@ -82,13 +178,108 @@ def browser(request):
     request.addfinalizer(browser_fin)
 
 
+@pytest.fixture(scope="session")
+def session_fingerprint(browser):
+    """Возвращает общую для всех тестов часть отпечатка для кэша
+    результатов: браузер и его версию, сборку приложения и
+    вспомогательные модули тестов. Если приложение не удалось
+    загрузить, то возвращает None, и кэш не используется.
+    """
+
+    app = app_fingerprint(URL)
+    if app is None:
+        return None
+
+    capabilities = browser.capabilities
+    version = capabilities.get("browserVersion", capabilities.get("version"))
+    return "|".join((capabilities.get("browserName", ""), str(version), app, support_fingerprint()))
+
+
+@pytest.fixture(scope="function")
+def result_cache(request):
+    """Данная фикстура пропускает тест, если включен кэш результатов
+    (--result-cache) и тест уже проходил успешно с тем же отпечатком
+    не позднее, чем --result-cache-ttl часов назад.
+    """
+
+    if not request.config.getoption("--result-cache"):
+        return
+
+    # Нагрузочные тесты работают с локальной копией приложения, а случайные
+    # и замеры производительности зависят от seed, времени и аргументов
+    # командной строки, поэтому они не кэшируются.
+    if request.node.get_closest_marker("load") or request.node.get_closest_marker("no_result_cache"):
+        return
+
+    common = request.getfixturevalue("session_fingerprint")
+    if common is None:
+        return
+
+    fingerprint = hashlib.sha256((common + function_fingerprint(request.function)).encode("utf-8")).hexdigest()
+    # Запоминаем отпечаток, чтобы сохранить результат после прогона теста.
+    request.node.result_fingerprint = fingerprint
+
+    if request.config.getoption("--force-run"):
+        return
+
+    entry = request.config.cache.get(CACHE_KEY, {}).get(request.node.nodeid)
+    ttl = request.config.getoption("--result-cache-ttl") * 3600
+    if entry and entry["fingerprint"] == fingerprint and time.time() - entry["time"] < ttl:
+        pytest.skip("cache hit: passed at {}".format(time.strftime("%Y-%m-%d %H:%M:%S",
+                                                                   time.localtime(entry["time"]))))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Сохраняет успешные результаты тестов в кэш результатов и
+    удаляет из него тесты, которые упали.
+    """
+
+    outcome = yield
+    report = outcome.get_result()
+
+    fingerprint = getattr(item, "result_fingerprint", None)
+    if fingerprint is None:
+        return
+
+    results = item.config.cache.get(CACHE_KEY, {})
+    if report.when == "call" and report.passed:
+        results[item.nodeid] = {"fingerprint": fingerprint, "time": time.time()}
+    elif report.failed:
+        results.pop(item.nodeid, None)
+    else:
+        return
+    item.config.cache.set(CACHE_KEY, results)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Выводит число тестов, пропущенных благодаря кэшу результатов."""
+
+    hits = [report for report in terminalreporter.stats.get("skipped", [])
+            if "cache hit" in str(report.longrepr)]
+    if hits:
+        terminalreporter.write_line("{} test(s) skipped as result cache hits "
+                                    "(use --force-run to run them).".format(len(hits)))
+
+
 @pytest.fixture(scope="function", autouse=True)
-def setup_test(request, browser):
+def setup_test(request):
     """Данная фикстура предназначена для вызова в начале
     каждого теста. В ней мы переходим по адресу приложения
     TodoMVC.
     """
 
+    # Нагрузочный тест сам запускает браузеры и открывает локальную
+    # копию приложения, а тестам без браузера приложение не нужно вовсе,
+    # поэтому здесь им ничего не нужно. Метки проверяются до получения
+    # браузера, чтобы он не запускался зря.
+    if request.node.get_closest_marker("load") or request.node.get_closest_marker("no_browser"):
+        return
+
+    # Проверяем кэш результатов до открытия приложения: тест может быть пропущен.
+    request.getfixturevalue("result_cache")
+    browser = request.getfixturevalue("browser")
+
     print("\nStarting new test...")
     # Открываем TodoMVC в браузере.
     browser.get(URL)
@@ -106,3 +297,39 @@ def setup_test(request, browser):
     # Добавляем функцию для автоматической очистки local storage после
     # каждого теста.
     request.addfinalizer(teardown_test)
+
+
+@pytest.fixture(scope="function")
+def page(browser):
+    """Возвращает объект страницы TodoMVC, который кэширует
+    найденные элементы в пределах одного теста. Вызывается
+    после setup_test, когда приложение уже открыто.
+    """
+
+    return TodoPage(browser)
+
+
+@pytest.fixture(scope="session")
+def latency(request, browser):
+    """Возвращает объект для сбора задержек от взаимодействия
+    до отрисовки. В конце тестовой сессии выводит отчет с
+    перцентилями и гистограммами по всем измерениям.
+    """
+
+    recorder = LatencyRecorder(browser)
+    yield recorder
+
+    def latency_fin():
+        """Функция для вывода отчета о задержках."""
+        report = recorder.report()
+        if report:
+            print("\nInteraction-to-render latency:\n" + report)
+
+    request.addfinalizer(latency_fin)
+
+
+@pytest.fixture(scope="session")
+def latency_repeats(request):
+    """Возвращает число измерений для каждого действия и размера списка."""
+
+    return request.config.getoption("--latency-repeats")
@@ -0,0 +1,177 @@
+import math
+from contextlib import contextmanager
+
+
+# JS-код, который устанавливает на странице датчик задержки. Датчик
+# слушает события в фазе перехвата, поэтому срабатывает раньше
+# обработчиков React. Задержка считается от метки времени самого
+# события (event.timeStamp) до следующего отрисованного кадра:
+# requestAnimationFrame вызывается перед отрисовкой, а setTimeout
+# внутри него - уже после того, как кадр отрисован.
+#
+# Аргументы: тип события ('click' или 'keydown') и CSS-селектор
+# элемента, на котором событие считается нужным взаимодействием.
+# Для 'keydown' учитывается только клавиша Enter.
+ARM_JS = """
+if (!window.__todoLatency) {
+    var probe = {samples: [], pending: 0, type: null, selector: null};
+
+    probe.listener = function (event) {
+        if (event.type !== probe.type || !event.target.matches || !event.target.matches(probe.selector)) {
+            return;
+        }
+        if (event.type === 'keydown' && event.key !== 'Enter') {
+            return;
+        }
+        var start = event.timeStamp;
+        probe.pending++;
+        requestAnimationFrame(function () {
+            setTimeout(function () {
+                probe.samples.push(performance.now() - start);
+                probe.pending--;
+            }, 0);
+        });
+    };
+
+    window.addEventListener('click', probe.listener, true);
+    window.addEventListener('keydown', probe.listener, true);
+    window.__todoLatency = probe;
+}
+window.__todoLatency.type = arguments[0];
+window.__todoLatency.selector = arguments[1];
+window.__todoLatency.samples = [];
+"""
+
+# Дожидается завершения всех начатых измерений и возвращает их,
+# отключая датчик до следующего вызова ARM_JS.
+COLLECT_JS = """
+var done = arguments[arguments.length - 1];
+var probe = window.__todoLatency;
+if (!probe) {
+    done([]);
+    return;
+}
+(function wait() {
+    if (probe.pending > 0) {
+        setTimeout(wait, 0);
+        return;
+    }
+    probe.type = null;
+    done(probe.samples);
+})();
+"""
+
+# Событие и элемент, которые запускают каждое из измеряемых действий.
+TRIGGERS = {
+    "adding_task": ("keydown", ".new-todo"),
+    "edit_task_name": ("keydown", ".edit"),
+    "mark_task_as_completed": ("click", ".toggle"),
+    "delete_task": ("click", ".destroy"),
+    "clear_completed_tasks": ("click", ".clear-completed"),
+}
+
+# Допустимая задержка (95-й перцентиль, мс) для каждого действия.
+# 100 мс - граница, после которой отклик на действие уже заметен
+# пользователю как задержка.
+BUDGETS = {
+    "adding_task": 100,
+    "edit_task_name": 100,
+    "mark_task_as_completed": 100,
+    "delete_task": 100,
+    "clear_completed_tasks": 100,
+}
+
+# Верхние границы корзин гистограммы, мс. Границы кратны длительности
+# кадра при 60 Гц.
+HISTOGRAM_BUCKETS = (16, 33, 50, 100, 200, 500)
+
+
+def percentile(values, percent):
+    """Возвращает перцентиль списка значений (метод ближайшего ранга).
+
+    :param values: Список значений.
+    :param percent: Перцентиль от 0 до 100.
+    """
+
+    ordered = sorted(values)
+    rank = max(int(math.ceil(percent / 100.0 * len(ordered))), 1)
+    return ordered[rank - 1]
+
+
+def histogram(values):
+    """Раскладывает значения по корзинам HISTOGRAM_BUCKETS.
+
+    :param values: Список значений, мс.
+    :return Список пар (подпись корзины, число значений).
+    """
+
+    counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+    for value in values:
+        for index, bound in enumerate(HISTOGRAM_BUCKETS):
+            if value <= bound:
+                counts[index] += 1
+                break
+        else:
+            counts[-1] += 1
+
+    labels = ["<={}".format(bound) for bound in HISTOGRAM_BUCKETS] + [">{}".format(HISTOGRAM_BUCKETS[-1])]
+    return list(zip(labels, counts))
+
+
+class LatencyRecorder:
+    """Собирает задержки от взаимодействия до отрисовки, измеренные
+    в браузере, и группирует их по действию и размеру списка.
+    """
+
+    def __init__(self, driver):
+        """:param driver: Объект браузера."""
+
+        self.driver = driver
+        # Измерения: (действие, размер списка) -> список задержек, мс.
+        self.samples = {}
+
+    @contextmanager
+    def measure(self, action, list_size):
+        """Измеряет задержку действия, выполненного внутри блока with.
+
+        :param action: Имя действия из TRIGGERS.
+        :param list_size: Число задач в списке перед действием.
+        """
+
+        event_type, selector = TRIGGERS[action]
+        self.driver.execute_script(ARM_JS, event_type, selector)
+        try:
+            yield
+        finally:
+            # Даже если действие упало, датчик нужно отключить, а уже
+            # полученные измерения - сохранить.
+            samples = self.driver.execute_async_script(COLLECT_JS)
+            self.samples.setdefault((action, list_size), []).extend(samples)
+
+    def over_budget(self, action, list_size):
+        """Возвращает 95-й перцентиль задержки, если он превышает
+        бюджет действия, иначе None.
+
+        :param action: Имя действия.
+        :param list_size: Размер списка.
+        """
+
+        value = percentile(self.samples[(action, list_size)], 95)
+        if value > BUDGETS[action]:
+            return value
+        return None
+
+    def report(self):
+        """Возвращает текстовый отчет с перцентилями и гистограммами
+        по каждому действию и размеру списка.
+        """
+
+        lines = []
+        for (action, list_size), values in sorted(self.samples.items()):
+            if not values:
+                continue
+            lines.append("{} (list size {}): n={}, p50={:.1f} ms, p95={:.1f} ms, max={:.1f} ms, budget={} ms".format(
+                action, list_size, len(values), percentile(values, 50), percentile(values, 95), max(values),
+                BUDGETS[action]))
+            lines.append("    " + "  ".join("{}: {}".format(label, count) for label, count in histogram(values)))
+        return "\n".join(lines)
@@ -0,0 +1,163 @@
+import functools
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from latency import percentile
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Обработчик запросов к статическим файлам, который не пишет
+    каждый запрос в консоль.
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_app(directory):
+    """Запускает в отдельном потоке HTTP-сервер, раздающий локальную
+    копию приложения.
+
+    :param directory: Путь к директории с приложением.
+    :return Кортеж (объект сервера, ссылка на приложение).
+    """
+
+    handler = functools.partial(QuietHandler, directory=directory)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, "http://127.0.0.1:{}/".format(server.server_address[1])
+
+
+class LoadStats:
+    """Потокобезопасное хранилище результатов сценариев. Каждый результат
+    запоминается вместе с числом активных пользователей в момент
+    запуска сценария, чтобы видеть, как меняются показатели по мере
+    роста нагрузки.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active_users = 0
+        # Результаты: (активные пользователи, сценарий, длительность в секундах, ошибка или None).
+        self.results = []
+        # Время, которое провел каждый уровень нагрузки, в секундах.
+        self.level_time = {}
+        self._level_started = time.perf_counter()
+
+    def _set_level(self, users):
+        """Меняет текущее число активных пользователей, записывая время,
+        проведенное на предыдущем уровне. Вызывается под блокировкой.
+        """
+
+        now = time.perf_counter()
+        self.level_time[self.active_users] = self.level_time.get(self.active_users, 0) + \
+            now - self._level_started
+        self._level_started = now
+        self.active_users = users
+
+    def user_started(self):
+        """Отмечает, что еще один пользователь запустил браузер и начал
+        выполнять сценарии. Время запуска браузера поэтому не попадает
+        во время нового уровня нагрузки.
+        """
+
+        with self._lock:
+            self._set_level(self.active_users + 1)
+
+    def stop(self):
+        """Завершает отсчет времени для текущего уровня нагрузки."""
+
+        with self._lock:
+            self._set_level(0)
+
+    def add(self, users, script, duration, error):
+        """Добавляет результат одного сценария."""
+
+        with self._lock:
+            self.results.append((users, script, duration, error))
+
+    def error_rate(self):
+        """Возвращает долю сценариев, завершившихся ошибкой."""
+
+        if not self.results:
+            return 0.0
+        return len([result for result in self.results if result[3] is not None]) / len(self.results)
+
+    def report(self):
+        """Возвращает текстовый отчет с пропускной способностью, долей
+        ошибок и перцентилями длительности для каждого уровня нагрузки.
+        """
+
+        lines = []
+        for users in sorted(set(result[0] for result in self.results)):
+            results = [result for result in self.results if result[0] == users]
+            durations = [result[2] * 1000 for result in results if result[3] is None]
+            errors = len(results) - len(durations)
+            elapsed = self.level_time.get(users, 0)
+            throughput = len(results) / elapsed if elapsed else 0.0
+            line = "{} user(s): {} scripts, {:.2f} scripts/s, error rate {:.1%}".format(
+                users, len(results), throughput, errors / len(results))
+            if durations:
+                line += ", p50={:.0f} ms, p90={:.0f} ms, p99={:.0f} ms".format(
+                    percentile(durations, 50), percentile(durations, 90), percentile(durations, 99))
+            lines.append(line)
+
+        errors = sorted(set(result[3] for result in self.results if result[3] is not None))
+        if errors:
+            lines.append("Errors:")
+            lines.extend("    " + error for error in errors)
+        return "\n".join(lines)
+
+
+class VirtualUser(threading.Thread):
+    """Виртуальный пользователь: в отдельном потоке и в собственном
+    браузере выполняет случайно выбранные по весам сценарии, пока
+    его не остановят.
+    """
+
+    def __init__(self, number, create_page, scripts, stats, stop):
+        """:param number: Номер пользователя, используется как seed.
+        :param create_page: Функция, которая открывает приложение в новом
+                            браузере и возвращает объект страницы.
+        :param scripts: Словарь: имя сценария -> (вес, функция(page, rng)).
+        :param stats: Объект LoadStats.
+        :param stop: threading.Event, по которому пользователь завершает работу.
+        """
+
+        super().__init__(daemon=True)
+        self.rng = random.Random(number)
+        self.create_page = create_page
+        self.scripts = scripts
+        self.stats = stats
+        self.stop = stop
+        self.page = None
+
+    def run(self):
+        names = list(self.scripts)
+        weights = [self.scripts[name][0] for name in names]
+
+        try:
+            self.page = self.create_page()
+        except Exception as error:
+            self.stats.add(self.stats.active_users, "start", 0, "{}: {}".format(type(error).__name__, error))
+            return
+
+        self.stats.user_started()
+        while not self.stop.is_set():
+            name = self.rng.choices(names, weights)[0]
+            users = self.stats.active_users
+            started = time.perf_counter()
+            try:
+                self.scripts[name][1](self.page, self.rng)
+                error = None
+            except Exception as exception:
+                error = "{}: {}: {}".format(name, type(exception).__name__, str(exception).strip().split("\n")[0])
+            self.stats.add(users, name, time.perf_counter() - started, error)
+
+    def quit(self):
+        """Закрывает браузер пользователя."""
+
+        if self.page is not None:
+            self.page.driver.quit()
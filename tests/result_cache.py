@@ -0,0 +1,149 @@
+import glob
+import hashlib
+import inspect
+import os
+import urllib.request
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+
+# Директория с тестами и вспомогательными модулями.
+TESTS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+# Ключ, под которым результаты хранятся в кэше pytest (.pytest_cache).
+CACHE_KEY = "todomvc/results"
+
+
+class AssetParser(HTMLParser):
+    """Собирает ссылки на ресурсы HTML-страницы: все <script src> (в том
+    числе 'text/babel' с .jsx) и все <link href>, независимо от
+    расширения и параметров запроса в ссылке.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.assets = set()
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "script" and attrs.get("src"):
+            self.assets.add(attrs["src"])
+        elif tag == "link" and attrs.get("href"):
+            self.assets.add(attrs["href"])
+
+
+def _fetch(url):
+    """Загружает содержимое по ссылке."""
+
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return response.read()
+
+
+def app_fingerprint(url):
+    """Возвращает отпечаток сборки приложения: хэш HTML-страницы и всех
+    скриптов и стилей, на которые она ссылается.
+
+    :param url: Ссылка на приложение.
+    :return Строка с хэшем или None, если приложение не удалось загрузить.
+    """
+
+    digest = hashlib.sha256()
+    try:
+        html = _fetch(url)
+        digest.update(html)
+        parser = AssetParser()
+        parser.feed(html.decode("utf-8", "replace"))
+        for asset in sorted(parser.assets):
+            digest.update(asset.encode("utf-8"))
+            digest.update(_fetch(urljoin(url, asset)))
+    except (OSError, ValueError):
+        return None
+    return digest.hexdigest()
+
+
+def support_fingerprint():
+    """Возвращает хэш всех вспомогательных модулей в директории с
+    тестами (conftest.py, объект страницы и т.д.), то есть всего,
+    кроме самих тестовых модулей.
+    """
+
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(TESTS_DIRECTORY, "*.py"))):
+        if os.path.basename(path).startswith("test_"):
+            continue
+        with open(path, "rb") as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+def _is_local(obj):
+    """Проверяет, что объект определен в одном из модулей директории с тестами."""
+
+    try:
+        path = inspect.getsourcefile(obj)
+    except TypeError:
+        return False
+    return path is not None and os.path.dirname(os.path.abspath(path)) == TESTS_DIRECTORY
+
+
+def _names(code):
+    """Возвращает все глобальные имена, которые использует код,
+    включая вложенные функции и lambda.
+    """
+
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _names(const)
+    return names
+
+
+def function_fingerprint(function):
+    """Возвращает хэш исходного кода тестовой функции и всех
+    вспомогательных функций, классов и констант, от которых она
+    зависит (рекурсивно, в пределах директории с тестами).
+
+    :param function: Тестовая функция.
+    """
+
+    digest = hashlib.sha256()
+    seen = set()
+    queue = [function]
+
+    def visit(obj):
+        """Добавляет в хэш значение, на которое ссылается код. В хэш
+        попадают только исходный код и простые значения, но не repr
+        произвольных объектов: в нем может быть адрес в памяти, и
+        отпечаток менялся бы от прогона к прогону.
+        """
+
+        if id(obj) in seen:
+            return
+        seen.add(id(obj))
+
+        if inspect.isfunction(obj):
+            if _is_local(obj):
+                queue.append(obj)
+        elif inspect.isclass(obj):
+            if _is_local(obj):
+                digest.update(inspect.getsource(obj).encode("utf-8"))
+        elif obj is None or isinstance(obj, (str, bytes, int, float, bool)):
+            digest.update(repr(obj).encode("utf-8"))
+        elif isinstance(obj, (tuple, list)):
+            digest.update("{}({})".format(type(obj).__name__, len(obj)).encode("utf-8"))
+            for item in obj:
+                visit(item)
+        elif isinstance(obj, dict):
+            digest.update("dict({})".format(len(obj)).encode("utf-8"))
+            for key, value in obj.items():
+                visit(key)
+                visit(value)
+
+    while queue:
+        current = queue.pop()
+        digest.update(inspect.getsource(current).encode("utf-8"))
+        for name in sorted(_names(current.__code__)):
+            if name in current.__globals__:
+                digest.update(name.encode("utf-8"))
+                visit(current.__globals__[name])
+
+    return digest.hexdigest()
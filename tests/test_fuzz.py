@@ -0,0 +1,371 @@
+import json
+import random
+import pytest
+from conftest import URL
+from todo_model import TodoModel, FILTERS
+
+
+# Результат зависит от seed и аргументов --fuzz-*, поэтому тест не берется из кэша результатов.
+pytestmark = pytest.mark.no_result_cache
+
+
+# JS-код, который выполняет в браузере пакет операций за один вызов
+# execute_async_script и после каждой операции снимает состояние
+# страницы. Между операциями выполняется ожидание одного цикла
+# событий, чтобы React успел перерисовать список.
+#
+# Ввод текста делается через нативный setter поля и событие 'input',
+# иначе React не заметит изменения значения поля. Перед первой
+# операцией скрипт ждет, пока приложение отрисуется, так как неявное
+# ожидание веб-драйвера на querySelector не распространяется.
+BATCH_JS = """
+var operations = arguments[0];
+var done = arguments[arguments.length - 1];
+
+function tick() {
+    return new Promise(function (resolve) { setTimeout(resolve, 0); });
+}
+
+function item(index) {
+    return document.querySelectorAll('.todo-list li')[index] || null;
+}
+
+function setValue(input, value) {
+    var setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    setter.call(input, value);
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+}
+
+function pressEnter(input) {
+    var event = new KeyboardEvent('keydown', {key: 'Enter', code: 'Enter', bubbles: true, cancelable: true});
+    Object.defineProperty(event, 'keyCode', {get: function () { return 13; }});
+    Object.defineProperty(event, 'which', {get: function () { return 13; }});
+    input.dispatchEvent(event);
+}
+
+function click(element) {
+    if (element) {
+        element.click();
+    }
+}
+
+var actions = {
+    add: async function (title) {
+        var input = document.querySelector('.new-todo');
+        setValue(input, title);
+        await tick();
+        pressEnter(input);
+    },
+    edit: async function (index, title) {
+        var li = item(index);
+        if (!li) {
+            return;
+        }
+        li.querySelector('label').dispatchEvent(new MouseEvent('dblclick', {bubbles: true}));
+        await tick();
+        var input = item(index).querySelector('.edit');
+        setValue(input, title);
+        await tick();
+        pressEnter(input);
+    },
+    toggle: async function (index) {
+        var li = item(index);
+        click(li && li.querySelector('.toggle'));
+    },
+    toggle_all: async function () {
+        click(document.querySelector('.toggle-all'));
+    },
+    delete: async function (index) {
+        var li = item(index);
+        click(li && li.querySelector('.destroy'));
+    },
+    clear_completed: async function () {
+        click(document.querySelector('.clear-completed'));
+    },
+    set_filter: async function (hash) {
+        if (window.location.hash !== hash) {
+            var changed = new Promise(function (resolve) {
+                window.addEventListener('hashchange', resolve, {once: true});
+            });
+            window.location.hash = hash;
+            await changed;
+        }
+    },
+    // Ничего не делает: используется, чтобы снять состояние страницы
+    // после обновления, выполненного через веб-драйвер.
+    refresh: async function () {
+    }
+};
+
+function snapshot() {
+    var items = document.querySelectorAll('.todo-list li');
+    var todos = [];
+    for (var i = 0; i < items.length; i++) {
+        todos.push([items[i].querySelector('label').textContent, items[i].classList.contains('completed')]);
+    }
+    var count = document.querySelector('.todo-count');
+    var toggleAll = document.querySelector('.toggle-all');
+    var selected = document.querySelector('.filters a.selected');
+    return {
+        todos: todos,
+        count: count ? parseInt(count.textContent, 10) : null,
+        clear: document.querySelector('.clear-completed') !== null,
+        toggle_all: toggleAll ? toggleAll.checked : null,
+        filter: selected ? selected.getAttribute('href') : null
+    };
+}
+
+// После загрузки или обновления страницы приложение может быть еще
+// не отрисовано, поэтому перед первой операцией ждем поле ввода.
+function ready() {
+    return new Promise(function (resolve) {
+        (function wait() {
+            if (document.querySelector('.new-todo')) {
+                resolve();
+            } else {
+                setTimeout(wait, 0);
+            }
+        })();
+    });
+}
+
+(async function () {
+    await ready();
+    var snapshots = [];
+    for (var i = 0; i < operations.length; i++) {
+        try {
+            await actions[operations[i][0]].apply(null, operations[i].slice(1));
+            await tick();
+            snapshots.push(snapshot());
+        } catch (error) {
+            snapshots.push({error: String(error)});
+            break;
+        }
+    }
+    done(snapshots);
+})();
+"""
+
+# Время на выполнение асинхронного скрипта по умолчанию (по спецификации
+# WebDriver), секунды.
+DEFAULT_SCRIPT_TIMEOUT = 30
+
+# Слова, из которых составляются названия задач.
+WORDS = ("buy", "milk", "write", "tests", "call", "mom", "fix", "bug", "read", "book")
+
+# Веса операций при случайной генерации последовательности.
+WEIGHTS = {
+    "add": 6,
+    "edit": 2,
+    "toggle": 4,
+    "toggle_all": 1,
+    "delete": 2,
+    "clear_completed": 1,
+    "set_filter": 2,
+    "refresh": 1,
+}
+
+
+def generate_title(rng):
+    """Данная функция предназначена для генерации названия задачи.
+    Иногда название дополняется пробелами по краям или состоит
+    только из пробелов, чтобы проверить обрезку названий.
+
+    :param rng: Генератор случайных чисел.
+    :return Название задачи.
+    """
+
+    if rng.random() < 0.05:
+        return " " * rng.randint(1, 3)
+    title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3)))
+    if rng.random() < 0.2:
+        title = "  " + title + " "
+    return title
+
+
+def generate_operations(rng, steps):
+    """Данная функция предназначена для генерации случайной
+    последовательности операций над списком задач. Индексы задач
+    выбираются с учетом состояния модели, чтобы большая часть
+    операций действительно меняла список.
+
+    :param rng: Генератор случайных чисел.
+    :param steps: Число операций.
+    :return Список операций вида (имя, аргументы...).
+    """
+
+    model = TodoModel()
+    names = list(WEIGHTS)
+    weights = [WEIGHTS[name] for name in names]
+    operations = []
+
+    while len(operations) < steps:
+        name = rng.choices(names, weights)[0]
+        visible = len(model.visible())
+
+        if name == "add":
+            operation = ("add", generate_title(rng))
+        elif name in ("edit", "toggle", "delete"):
+            # Операции над одной задачей возможны, только если она видна.
+            if not visible:
+                continue
+            index = rng.randrange(visible)
+            operation = ("edit", index, generate_title(rng)) if name == "edit" else (name, index)
+        elif name == "set_filter":
+            operation = ("set_filter", rng.choice(list(FILTERS)))
+        else:
+            operation = (name,)
+
+        model.apply(operation)
+        operations.append(operation)
+
+    return operations
+
+
+def to_js(operation):
+    """Данная функция предназначена для преобразования операции
+    в вид, понятный JS-коду BATCH_JS.
+
+    :param operation: Операция вида (имя, аргументы...).
+    :return Список из имени операции и её аргументов.
+    """
+
+    if operation[0] == "set_filter":
+        # В браузере фильтр переключается сменой адреса после '#'.
+        return ["set_filter", FILTERS[operation[1]]]
+    return list(operation)
+
+
+def reset_app(driver):
+    """Данная функция предназначена для возврата приложения в
+    начальное состояние: пустой список и фильтр 'All'.
+
+    :param driver: Объект браузера.
+    """
+
+    driver.get(URL)
+    driver.execute_script("window.localStorage.clear();")
+    driver.refresh()
+
+
+def run_operations(driver, operations, batch_size):
+    """Данная функция предназначена для выполнения последовательности
+    операций в браузере и сверки каждого шага с эталонной моделью.
+
+    Операции отправляются в браузер пакетами по batch_size штук,
+    обновление страницы разрывает пакет, так как выполняется через
+    сам веб-драйвер.
+
+    :param driver: Объект браузера.
+    :param operations: Список операций.
+    :param batch_size: Максимальное число операций в одном пакете.
+    :return None, если все шаги совпали с моделью. Иначе кортеж
+            (индекс шага, ожидаемое состояние, полученное состояние).
+    """
+
+    reset_app(driver)
+    model = TodoModel()
+    position = 0
+
+    while position < len(operations):
+        if operations[position][0] == "refresh":
+            # Обновляем страницу и снимаем её состояние отдельным вызовом.
+            driver.refresh()
+            batch = [operations[position]]
+        else:
+            batch = []
+            for operation in operations[position:position + batch_size]:
+                if operation[0] == "refresh":
+                    break
+                batch.append(operation)
+        snapshots = driver.execute_async_script(BATCH_JS, [to_js(operation) for operation in batch])
+
+        for offset, operation in enumerate(batch):
+            model.apply(operation)
+            expected = model.snapshot()
+            actual = snapshots[offset] if offset < len(snapshots) else None
+            if actual != expected:
+                return position + offset, expected, actual
+
+        position += len(batch)
+
+    return None
+
+
+def shrink_operations(driver, operations, failure, batch_size, max_attempts):
+    """Данная функция предназначена для сокращения последовательности
+    операций, на которой приложение разошлось с моделью, до минимальной.
+
+    Из последовательности по очереди выбрасываются куски всё меньшего
+    размера. Если без куска расхождение все еще воспроизводится, то
+    кусок удаляется окончательно.
+
+    :param driver: Объект браузера.
+    :param operations: Последовательность, на которой найдено расхождение.
+    :param failure: Результат run_operations для этой последовательности.
+    :param batch_size: Максимальное число операций в одном пакете.
+    :param max_attempts: Максимальное число повторных прогонов.
+    :return Кортеж (минимальная последовательность, результат run_operations для неё).
+    """
+
+    # Всё, что идет после первого расхождения, не нужно для воспроизведения.
+    operations = operations[:failure[0] + 1]
+    attempts = 0
+    chunk = max(len(operations) // 2, 1)
+
+    while chunk >= 1 and attempts < max_attempts:
+        start = 0
+        while start < len(operations) and attempts < max_attempts:
+            candidate = operations[:start] + operations[start + chunk:]
+            result = run_operations(driver, candidate, batch_size) if candidate else None
+            attempts += 1
+            if result is not None:
+                operations, failure = candidate[:result[0] + 1], result
+            else:
+                start += chunk
+        chunk //= 2
+
+    return operations, failure
+
+
+def test_fuzz_against_model(browser, request):
+    """Случайное тестирование TodoMVC по эталонной модели.
+
+    Данный тест генерирует длинную случайную последовательность
+    операций (добавление, редактирование, отметка, удаление задач,
+    переключение фильтров и обновление страницы) и после каждой
+    операции сверяет состояние страницы с эталонной моделью. При
+    расхождении последовательность сокращается до минимальной,
+    которая его воспроизводит.
+    """
+
+    seed = request.config.getoption("--fuzz-seed")
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    steps = request.config.getoption("--fuzz-steps")
+    batch_size = request.config.getoption("--fuzz-batch")
+
+    print("\nFuzzing with seed {} ({} steps)...".format(seed, steps))
+    operations = generate_operations(random.Random(seed), steps)
+
+    # Пакет операций может выполняться дольше, чем время по умолчанию.
+    # Браузер общий для всей сессии, поэтому после теста время
+    # возвращается к значению по умолчанию.
+    browser.set_script_timeout(max(DEFAULT_SCRIPT_TIMEOUT, batch_size))
+    try:
+        failure = run_operations(browser, operations, batch_size)
+        if failure is None:
+            return
+
+        operations, (index, expected, actual) = shrink_operations(browser, operations, failure, batch_size,
+                                                                   request.config.getoption("--fuzz-shrink"))
+    finally:
+        browser.set_script_timeout(DEFAULT_SCRIPT_TIMEOUT)
+
+    pytest.fail("TodoMVC diverged from the model (seed {}).\n"
+                "Minimal sequence:\n{}\n"
+                "Step {}: {}\n"
+                "Expected: {}\n"
+                "Actual:   {}".format(seed, "\n".join(json.dumps(operation) for operation in operations),
+                                      index, json.dumps(operations[index]),
+                                      json.dumps(expected), json.dumps(actual)))
@@ -0,0 +1,113 @@
+import pytest
+from test_todos import (adding_task, delete_task, edit_task_name, mark_task_as_completed,
+                        get_current_tasks_from_todo_list, clear_completed_tasks)
+
+
+# Замеры производительности не берутся из кэша результатов.
+pytestmark = pytest.mark.no_result_cache
+
+
+# Размеры списка, на которых измеряется задержка.
+LIST_SIZES = (1, 10, 50)
+
+
+def fill_todo_list(page, list_size):
+    """Данная функция предназначена для заполнения списка
+    задачами, чтобы измерять задержку на списке нужного размера.
+
+    :param page: Объект страницы TodoMVC.
+    :param list_size: Число задач в списке.
+    """
+
+    adding_task(["Task {}".format(number) for number in range(list_size)], page)
+
+
+def check_budget(latency, action, list_size, repeats):
+    """Данная функция предназначена для проверки того, что все
+    измерения были получены и что задержка укладывается в бюджет.
+
+    :param latency: Объект LatencyRecorder.
+    :param action: Имя действия.
+    :param list_size: Размер списка.
+    :param repeats: Ожидаемое число измерений.
+    """
+
+    assert len(latency.samples[(action, list_size)]) == repeats
+    value = latency.over_budget(action, list_size)
+    assert value is None, "p95 latency of {} is {:.1f} ms".format(action, value)
+
+
+@pytest.mark.parametrize("list_size", LIST_SIZES)
+def test_adding_task_latency(page, latency, latency_repeats, list_size):
+    """Задержка отрисовки после добавления задачи клавишей Enter."""
+
+    # Как и для остальных действий, размер - это число задач до добавления.
+    fill_todo_list(page, list_size)
+
+    for number in range(latency_repeats):
+        with latency.measure("adding_task", list_size):
+            adding_task("Measured task {}".format(number), page)
+        # Удаляем добавленную задачу, чтобы размер списка не менялся.
+        delete_task(get_current_tasks_from_todo_list(page)[-1], page)
+
+    check_budget(latency, "adding_task", list_size, latency_repeats)
+
+
+@pytest.mark.parametrize("list_size", LIST_SIZES)
+def test_mark_task_as_completed_latency(page, latency, latency_repeats, list_size):
+    """Задержка отрисовки после нажатия на отметку 'выполнена'."""
+
+    fill_todo_list(page, list_size)
+    task = get_current_tasks_from_todo_list(page, get_one_task=True)
+
+    for _ in range(latency_repeats):
+        with latency.measure("mark_task_as_completed", list_size):
+            mark_task_as_completed(task, page)
+
+    check_budget(latency, "mark_task_as_completed", list_size, latency_repeats)
+
+
+@pytest.mark.parametrize("list_size", LIST_SIZES)
+def test_delete_task_latency(page, latency, latency_repeats, list_size):
+    """Задержка отрисовки после удаления задачи."""
+
+    fill_todo_list(page, list_size)
+
+    for number in range(latency_repeats):
+        task = get_current_tasks_from_todo_list(page)[-1]
+        with latency.measure("delete_task", list_size):
+            delete_task(task, page)
+        # Возвращаем удаленную задачу, чтобы размер списка не менялся.
+        adding_task("Task {}".format(number), page)
+
+    check_budget(latency, "delete_task", list_size, latency_repeats)
+
+
+@pytest.mark.parametrize("list_size", LIST_SIZES)
+def test_clear_completed_tasks_latency(page, latency, latency_repeats, list_size):
+    """Задержка отрисовки после удаления всех 'выполненных' задач."""
+
+    fill_todo_list(page, list_size)
+
+    for number in range(latency_repeats):
+        mark_task_as_completed(get_current_tasks_from_todo_list(page)[-1], page)
+        with latency.measure("clear_completed_tasks", list_size):
+            clear_completed_tasks(page)
+        # Возвращаем удаленную задачу, чтобы размер списка не менялся.
+        adding_task("Task {}".format(number), page)
+
+    check_budget(latency, "clear_completed_tasks", list_size, latency_repeats)
+
+
+@pytest.mark.parametrize("list_size", LIST_SIZES)
+def test_edit_task_name_latency(page, latency, latency_repeats, list_size):
+    """Задержка отрисовки после подтверждения нового названия задачи."""
+
+    fill_todo_list(page, list_size)
+
+    for number in range(latency_repeats):
+        task = get_current_tasks_from_todo_list(page, get_one_task=True)
+        with latency.measure("edit_task_name", list_size):
+            edit_task_name(task, "Edited task {}".format(number), page)
+
+    check_budget(latency, "edit_task_name", list_size, latency_repeats)
@@ -0,0 +1,164 @@
+import time
+import threading
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from conftest import create_browser, SUPPORTED_BROWSERS
+from load import serve_app, LoadStats, VirtualUser
+from todo_page import TodoPage, WAIT_FOR_APP_JS
+from test_todos import (adding_task, delete_task, mark_task_as_completed, clear_completed_tasks,
+                        get_current_tasks_from_todo_list, get_completed_tasks_from_todo_list)
+
+
+# Максимальное число задач, которое держит в списке один пользователь.
+MAX_TASKS = 20
+
+
+def visible_tasks(page):
+    """Данная функция предназначена для получения видимых задач
+    без ошибки, если списка на странице нет.
+
+    :param page: Объект страницы TodoMVC.
+    :return Список задач.
+    """
+
+    try:
+        return get_current_tasks_from_todo_list(page)
+    except NoSuchElementException:
+        return []
+
+
+def add_script(page, rng):
+    """Сценарий: пользователь добавляет задачу."""
+
+    if len(visible_tasks(page)) >= MAX_TASKS:
+        page.show_filter("all")
+        for task in visible_tasks(page)[:MAX_TASKS // 2]:
+            delete_task(task, page)
+    adding_task("Task {}".format(rng.randrange(1000)), page)
+
+
+def complete_script(page, rng):
+    """Сценарий: пользователь отмечает задачу как 'выполненную'."""
+
+    tasks = visible_tasks(page)
+    if tasks:
+        mark_task_as_completed(rng.choice(tasks), page)
+
+
+def delete_script(page, rng):
+    """Сценарий: пользователь удаляет задачу."""
+
+    tasks = visible_tasks(page)
+    if tasks:
+        delete_task(rng.choice(tasks), page)
+
+
+def clear_completed_script(page, rng):
+    """Сценарий: пользователь удаляет все 'выполненные' задачи."""
+
+    try:
+        has_completed = bool(get_completed_tasks_from_todo_list(page))
+    except NoSuchElementException:
+        has_completed = False
+    if has_completed:
+        clear_completed_tasks(page)
+
+
+def filter_script(page, rng):
+    """Сценарий: пользователь переключает фильтр."""
+
+    page.show_filter(rng.choice(("all", "active", "completed")))
+
+
+def reload_script(page, rng):
+    """Сценарий: пользователь обновляет страницу."""
+
+    page.reload_and_wait()
+
+
+# Сценарии виртуальных пользователей: имя -> (вес, функция).
+SCRIPTS = {
+    "add": (4, add_script),
+    "complete": (3, complete_script),
+    "delete": (2, delete_script),
+    "clear_completed": (1, clear_completed_script),
+    "filter": (2, filter_script),
+    "reload": (1, reload_script),
+}
+
+
+@pytest.mark.load
+def test_load(request):
+    """Нагрузочный тест TodoMVC.
+
+    Данный тест запускает по очереди --load-users виртуальных
+    пользователей, каждый в собственном браузере, которые выполняют
+    случайные сценарии на локальной копии приложения. В конце
+    выводится пропускная способность, доля ошибок и перцентили
+    длительности сценариев для каждого уровня нагрузки.
+    """
+
+    users = request.config.getoption("--load-users")
+    app_dir = request.config.getoption("--app-dir")
+    if users <= 0 or app_dir is None:
+        pytest.skip("load mode is off: pass --load-users and --app-dir to enable it")
+
+    browser_name = request.config.getoption("--browser")
+    # Проверяем браузер заранее, иначе каждый пользователь упадет при запуске.
+    if browser_name.lower() not in SUPPORTED_BROWSERS:
+        pytest.fail("Tests for browser '{}' are not implemented.".format(browser_name))
+    ramp = request.config.getoption("--load-ramp")
+    duration = request.config.getoption("--load-duration")
+
+    server, url = serve_app(app_dir)
+
+    def create_page():
+        """Открывает приложение в новом браузере без UI."""
+        driver = create_browser(browser_name, headless=True)
+        try:
+            driver.implicitly_wait(0)
+            driver.get(url)
+            # Приложение отрисовывается после события load, поэтому ждем его явно:
+            # неявное ожидание здесь выключено.
+            driver.execute_async_script(WAIT_FOR_APP_JS)
+        except Exception:
+            # Пользователь так и не запустится, поэтому закрываем его браузер сразу.
+            driver.quit()
+            raise
+        return TodoPage(driver)
+
+    stats = LoadStats()
+    stop = threading.Event()
+    virtual_users = []
+
+    try:
+        # Запускаем пользователей по одному, повышая нагрузку.
+        for number in range(users):
+            user = VirtualUser(number, create_page, SCRIPTS, stats, stop)
+            user.start()
+            virtual_users.append(user)
+            print("\nStarting virtual user {}/{}".format(number + 1, users))
+            # После последнего пользователя пауза не нужна: дальше идет полная нагрузка.
+            if number + 1 < users:
+                time.sleep(ramp)
+
+        # Держим полную нагрузку.
+        time.sleep(duration)
+    finally:
+        stop.set()
+        for user in virtual_users:
+            user.join()
+        # Уровень закрывается только после того, как все начатые сценарии
+        # завершились, иначе их результаты попадут в отчет без своего времени.
+        # Закрытие браузеров в это время уже не входит.
+        stats.stop()
+        for user in virtual_users:
+            user.quit()
+        server.shutdown()
+        server.server_close()
+
+    print("\nLoad test report:\n" + stats.report())
+
+    max_error_rate = request.config.getoption("--load-max-error-rate")
+    assert stats.results, "virtual users did not complete any script"
+    assert stats.error_rate() <= max_error_rate
@@ -0,0 +1,135 @@
+import os
+import shutil
+import pytest
+from result_cache import TESTS_DIRECTORY
+
+
+# Эти тесты запускают pytest внутри себя и не используют браузер.
+pytestmark = [pytest.mark.no_browser, pytest.mark.no_result_cache]
+
+# Модули, которые нужны conftest.py во вложенном прогоне.
+SUPPORT_MODULES = ("conftest.py", "todo_page.py", "todo_model.py", "latency.py", "result_cache.py")
+
+# Тестовый модуль для вложенного прогона. Браузер подменен заглушкой,
+# а отпечаток сессии берется из переменной окружения, чтобы не
+# запускать браузер и не загружать приложение из сети.
+SAMPLE_TESTS = """
+import os
+import pytest
+
+
+class FakeBrowser:
+    def get(self, url):
+        pass
+
+    def execute_script(self, script, *args):
+        pass
+
+    def refresh(self):
+        pass
+
+
+@pytest.fixture(scope="session")
+def browser():
+    return FakeBrowser()
+
+
+@pytest.fixture(scope="session")
+def session_fingerprint():
+    return os.environ.get("SAMPLE_FINGERPRINT", "build-1")
+
+
+def test_passing():
+    pass
+
+
+def test_flaky():
+    assert not os.environ.get("SAMPLE_FAIL")
+
+
+@pytest.mark.no_result_cache
+def test_not_cached():
+    pass
+
+
+@pytest.mark.load
+def test_load_like():
+    pass
+"""
+
+
+@pytest.fixture
+def sample(pytester):
+    """Данная фикстура готовит директорию для вложенного прогона:
+    копирует conftest.py с его модулями и создает тестовый модуль.
+    """
+
+    for name in SUPPORT_MODULES:
+        shutil.copy(os.path.join(TESTS_DIRECTORY, name), str(pytester.path))
+    pytester.makepyfile(test_sample=SAMPLE_TESTS)
+    return pytester
+
+
+def run(pytester, *args):
+    """Данная функция предназначена для запуска вложенного прогона
+    в отдельном процессе, чтобы модули conftest не смешивались.
+
+    :param pytester: Объект pytester.
+    :param args: Аргументы командной строки pytest.
+    :return Результат прогона.
+    """
+
+    return pytester.runpytest_subprocess(*args)
+
+
+def test_second_run_is_cache_hit(sample):
+    """Повторный прогон с тем же отпечатком пропускает успешные тесты."""
+
+    run(sample, "--result-cache").assert_outcomes(passed=4)
+
+    result = run(sample, "--result-cache", "-rs")
+    result.assert_outcomes(passed=2, skipped=2)
+    result.stdout.fnmatch_lines(["2 test(s) skipped as result cache hits*", "SKIPPED*cache hit: passed at*"])
+
+
+def test_cache_is_opt_in(sample):
+    """Без --result-cache ничего не пропускается."""
+
+    run(sample).assert_outcomes(passed=4)
+    run(sample).assert_outcomes(passed=4)
+
+
+def test_changed_fingerprint_is_cache_miss(sample, monkeypatch):
+    """Изменение отпечатка (сборки приложения, браузера) отменяет кэш."""
+
+    run(sample, "--result-cache").assert_outcomes(passed=4)
+
+    monkeypatch.setenv("SAMPLE_FINGERPRINT", "build-2")
+    run(sample, "--result-cache").assert_outcomes(passed=4)
+
+
+def test_expired_result_is_cache_miss(sample):
+    """Результаты старше --result-cache-ttl не используются."""
+
+    run(sample, "--result-cache").assert_outcomes(passed=4)
+    run(sample, "--result-cache", "--result-cache-ttl=0").assert_outcomes(passed=4)
+
+
+def test_force_run_ignores_and_records(sample):
+    """--force-run прогоняет все тесты, но продолжает записывать результаты."""
+
+    run(sample, "--result-cache", "--force-run").assert_outcomes(passed=4)
+    run(sample, "--result-cache", "--force-run").assert_outcomes(passed=4)
+    run(sample, "--result-cache").assert_outcomes(passed=2, skipped=2)
+
+
+def test_failure_removes_result(sample, monkeypatch):
+    """Упавший тест удаляется из кэша и в следующий раз прогоняется снова."""
+
+    run(sample, "--result-cache").assert_outcomes(passed=4)
+
+    monkeypatch.setenv("SAMPLE_FAIL", "1")
+    run(sample, "--result-cache", "--force-run").assert_outcomes(passed=3, failed=1)
+
+    monkeypatch.delenv("SAMPLE_FAIL")
+    run(sample, "--result-cache").assert_outcomes(passed=3, skipped=1)
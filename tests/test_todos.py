@@ -4,31 +4,29 @@ from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.action_chains import ActionChains
 
 
-def adding_task(task_names, driver):
+def adding_task(task_names, page):
     """Данная функция предназначена для добавления задачи
     в список задач.
 
     :param task_names: Имена задач. Может быть одной строкой или списком строк.
-    :param driver: Объект браузера.
+    :param page: Объект страницы TodoMVC.
     """
 
-    # Находим элемент для ввода новой задачи.
-    new_todo = driver.find_element_by_class_name("new-todo")
     # Записываем имена всех задач, если их несколько.
     if isinstance(task_names, list):
         for task_name in task_names:
-            new_todo.send_keys(task_name + Keys.ENTER)
+            page.send_keys("new_todo", task_name + Keys.ENTER)
     else:
         # Записываем имя задачи, если она одна.
-        new_todo.send_keys(task_names + Keys.ENTER)
+        page.send_keys("new_todo", task_names + Keys.ENTER)
 
 
-def delete_task(task, driver):
+def delete_task(task, page):
     """Данная функция предназначена для удаления задачи
     из списка задач.
 
     :param task: Объект задачи под удаление.
-    :param driver: Объект браузера.
+    :param page: Объект страницы TodoMVC.
     """
 
     # Нажимаем на кнопку удаления задачи.
@@ -38,16 +36,16 @@ def delete_task(task, driver):
     # подсказывает, что это проблема Selenium и советует использовать
     # готовый JS-код для клика на кнопки в таких ситуациях.
     destroy_button = task.find_element_by_class_name("destroy")
-    driver.execute_script("arguments[0].click();", destroy_button)
+    page.click(destroy_button)
 
 
-def edit_task_name(task, new_task_name, driver):
+def edit_task_name(task, new_task_name, page):
     """Данная функция предназначена для изменения имени
     задачи в списке.
 
     :param task: Объект задачи под удаление.
     :param new_task_name: Новое имя задачи.
-    :param driver: Объект браузера.
+    :param page: Объект страницы TodoMVC.
     """
 
     # Получаем предыдущее имя задачи.
@@ -55,7 +53,7 @@ def edit_task_name(task, new_task_name, driver):
 
     # Дважды кликаем на название задачи, чтобы она стала редактируемой.
     view = task.find_element_by_class_name("view")
-    action_chains = ActionChains(driver)
+    action_chains = ActionChains(page.driver)
     action_chains.double_click(view).perform()
 
     # Повторно вытягиваем задачу в режиме редактирования.
@@ -67,26 +65,26 @@ def edit_task_name(task, new_task_name, driver):
     edit_input.send_keys(new_task_name, Keys.ENTER)
 
 
-def mark_task_as_completed(task, driver):
+def mark_task_as_completed(task, page):
     """Данная функция предназначена для отметки
     задачи как 'выполненной'.
 
     :param task: Объект задачи под удаление.
-    :param driver: Объект браузера.
+    :param page: Объект страницы TodoMVC.
     """
 
     # Получаем кнопку для отметки задачи.
     toggle_button = task.find_element_by_class_name("toggle")
 
     # Нажимаем на кнопку.
-    driver.execute_script("arguments[0].click();", toggle_button)
+    page.click(toggle_button)
 
 
-def get_current_tasks_from_todo_list(driver, get_one_task=False):
+def get_current_tasks_from_todo_list(page, get_one_task=False):
     """Данная функция предназначена для получения
     всех задач из списка.
 
-    :param driver: Объект браузера.
+    :param page: Объект страницы TodoMVC.
     :param get_one_task: Флаг, выставляемый в случае, когда нужно
                          получить не список задач, а одну задачу.
     :return Если выбран флаг get_one_task, то должна вернутся одна
@@ -95,24 +93,21 @@ def get_current_tasks_from_todo_list(driver, get_one_task=False):
             будет пустым.
     """
 
-    # Находим список.
-    todo_list = driver.find_element_by_class_name("todo-list")
-
     if get_one_task:
         # Вытягиваем первую попавшуюся запись в списке.
-        task = todo_list.find_element_by_tag_name("li")
+        task = page.call("todo_list", lambda todo_list: todo_list.find_element_by_tag_name("li"))
         return task
     else:
         # Вытягиваем из списка все задачи.
-        tasks = todo_list.find_elements_by_tag_name("li")
+        tasks = page.call("todo_list", lambda todo_list: todo_list.find_elements_by_tag_name("li"))
         return tasks
 
 
-def get_completed_tasks_from_todo_list(driver, get_one_task=False):
+def get_completed_tasks_from_todo_list(page, get_one_task=False):
     """Данная функция предназначена для получения
     всех 'выполненных' задач из списка.
 
-    :param driver: Объект браузера.
+    :param page: Объект страницы TodoMVC.
     :param get_one_task: Флаг, выставляемый в случае, когда нужно
                          получить не список задач, а одну задачу.
     :return Если выбран флаг get_one_task, то должна вернутся одна
@@ -121,48 +116,42 @@ def get_completed_tasks_from_todo_list(driver, get_one_task=False):
             будет пустым.
     """
 
-    # Находим список.
-    todo_list = driver.find_element_by_class_name("todo-list")
-
     if get_one_task:
         # Вытягиваем первую попавшуюся запись в списке.
-        completed_task = todo_list.find_element_by_class_name("completed")
+        completed_task = page.call("todo_list", lambda todo_list: todo_list.find_element_by_class_name("completed"))
         return completed_task
     else:
         # Вытягиваем из списка все выполненные задачи.
-        completed_tasks = todo_list.find_elements_by_class_name("completed")
+        completed_tasks = page.call("todo_list",
+                                    lambda todo_list: todo_list.find_elements_by_class_name("completed"))
         return completed_tasks
 
 
-def clear_completed_tasks(driver):
+def clear_completed_tasks(page):
     """Данная функция предназначена для очистки всех задач,
     помеченных как 'выполненные'.
 
-    :param driver: Объект браузера.
+    :param page: Объект страницы TodoMVC.
     """
 
-    # Обращаемся к footer'у списка.
-    footer = driver.find_element_by_class_name("footer")
     # Получаем кнопку для удаления выполненных задач и нажимаем её.
-    clear_completed_button = footer.find_element_by_class_name("clear-completed")
-    driver.execute_script("arguments[0].click();", clear_completed_button)
+    page.click_element("clear_completed")
 
 
-def check_number_of_active_tasks(driver):
+def check_number_of_active_tasks(page):
     """Данная функция предназначена для получения числа
     задач, не отмеченных как 'выполненные'.
 
-    :param driver: Объект браузера.
+    :param page: Объект страницы TodoMVC.
     """
 
     # Находим число задач и проверяем их число.
-    todo_count = driver.find_element_by_class_name("todo-count")
-    number = int(todo_count.find_element_by_tag_name("strong").text)
+    number = page.call("todo_count", lambda todo_count: int(todo_count.find_element_by_tag_name("strong").text))
     return number
 
 
 @pytest.mark.parametrize("title, placeholder_text", (("React • TodoMVC", "What needs to be done?"),))
-def test_opening_and_finding_input(browser, title, placeholder_text):
+def test_opening_and_finding_input(page, title, placeholder_text):
     """TC ID: TodoMVC-0 - Доступ и отображение начальной страницы TodoMVC
 
     Данный тест-кейс предназначен для проверки того, что приложение в
@@ -171,13 +160,13 @@ def test_opening_and_finding_input(browser, title, placeholder_text):
     """
 
     # Находим заголовок страницы и сравниваем с ожидаемым.
-    page_title = browser.title
+    page_title = page.driver.title
     assert page_title == title
 
     # Проверяем, что на странице есть элемент для ввода новой задачи.
     # и поле с текстом по умолчанию.
     # (Иначе, вылетает исключение NoSuchElementException)
-    new_todo = browser.find_element_by_class_name("new-todo")
+    new_todo = page.element("new_todo")
     placeholder = new_todo.get_attribute("placeholder")
 
     # Проверяем, что текст по умолчанию в поле для ввода соответствует ожидаемому.
@@ -185,7 +174,7 @@ def test_opening_and_finding_input(browser, title, placeholder_text):
 
 
 @pytest.mark.parametrize("task_name", ("Adding new task",))
-def test_adding_task(browser, task_name):
+def test_adding_task(page, task_name):
     """TC ID: TodoMVC-1 - Добавить новую задачу
 
     Данный тест-кейс предназначен для проверки того, что
@@ -195,10 +184,10 @@ def test_adding_task(browser, task_name):
     """
 
     # Добавляем задачу.
-    adding_task(task_name, browser)
+    adding_task(task_name, page)
 
     # Проверяем, что появилась задача.
-    task = get_current_tasks_from_todo_list(browser, get_one_task=True)
+    task = get_current_tasks_from_todo_list(page, get_one_task=True)
 
     # Проверяем, что название задачи совпадает с введенным.
     name = task.find_element_by_tag_name("label").text
@@ -206,12 +195,12 @@ def test_adding_task(browser, task_name):
 
     # Проверяем, что в нижней части формы появилась
     # панель для фильтрации и управления списком.
-    footer = browser.find_element_by_class_name("footer")
+    footer = page.element("footer")
     assert footer is not None
 
 
 @pytest.mark.parametrize("task_names", (["Task 1", "Task 2"],))
-def test_adding_task_to_non_empty_list(browser, task_names):
+def test_adding_task_to_non_empty_list(page, task_names):
     """TC ID: TodoMVC-2 - Добавить новую задачу в непустой список
 
     Данный тест-кейс предназначен для проверки того, что
@@ -221,10 +210,10 @@ def test_adding_task_to_non_empty_list(browser, task_names):
     """
 
     # Добавляем задачи.
-    adding_task(task_names, browser)
+    adding_task(task_names, page)
 
     # Вытягиваем задачи, которые сейчас есть в списке.
-    tasks = get_current_tasks_from_todo_list(browser)
+    tasks = get_current_tasks_from_todo_list(page)
 
     # Проверяем, что число полученных задач соответствует
     # длине списка с названиями задач.
@@ -239,7 +228,7 @@ def test_adding_task_to_non_empty_list(browser, task_names):
 
 
 @pytest.mark.parametrize("task_name", ("Delete this task",))
-def test_delete_task(browser, task_name):
+def test_delete_task(page, task_name):
     """TC ID: TodoMVC-3 - Удалить задачу
 
     Данный тест-кейс предназначен для проверки того, что
@@ -248,22 +237,22 @@ def test_delete_task(browser, task_name):
     """
 
     # Добавляем задачу.
-    adding_task(task_name, browser)
+    adding_task(task_name, page)
 
     # Вытягиваем задачу.
-    task = get_current_tasks_from_todo_list(browser, get_one_task=True)
+    task = get_current_tasks_from_todo_list(page, get_one_task=True)
 
     # Удаляем задачу.
-    delete_task(task, browser)
+    delete_task(task, page)
 
     # Проверяем, что списка и подложки списка больше не существует.
     with pytest.raises(NoSuchElementException):
-        browser.find_element_by_class_name("todo-list")
-        browser.find_element_by_class_name("footer")
+        page.driver.find_element_by_class_name("todo-list")
+        page.driver.find_element_by_class_name("footer")
 
 
 @pytest.mark.parametrize("task_for_deleting, task_for_saving", (("This must be deleted", "This must be saved"),))
-def test_delete_task_from_non_empty_list(browser, task_for_deleting, task_for_saving):
+def test_delete_task_from_non_empty_list(page, task_for_deleting, task_for_saving):
     """TC ID: TodoMVC-4 - Удалить задачу из непустого списка.
 
     Данный тест-кейс предназначен для проверки того, что
@@ -275,10 +264,10 @@ def test_delete_task_from_non_empty_list(browser, task_for_deleting, task_for_sa
     task_names = [task_for_deleting, task_for_saving]
 
     # Находим элемент для ввода новой задачи и записываем название.
-    adding_task(task_names, browser)
+    adding_task(task_names, page)
 
     # Получаем список всех задач.
-    tasks = get_current_tasks_from_todo_list(browser)
+    tasks = get_current_tasks_from_todo_list(page)
 
     # Перебираем все задачи, ищем ту, что нужно удалить.
     for task in tasks:
@@ -286,10 +275,10 @@ def test_delete_task_from_non_empty_list(browser, task_for_deleting, task_for_sa
 
         # Если задача совпадает по имени, удаляем её:
         if label == task_for_deleting:
-            delete_task(task, browser)
+            delete_task(task, page)
 
     # Снова вытягиваем задачи.
-    tasks = get_current_tasks_from_todo_list(browser)
+    tasks = get_current_tasks_from_todo_list(page)
     # Проверяем, что длина списка стала меньше.
     assert len(tasks) + 1 == len(task_names)
 
@@ -307,7 +296,7 @@ def test_delete_task_from_non_empty_list(browser, task_for_deleting, task_for_sa
 
 
 @pytest.mark.parametrize("task_name", ("This task will be marked as completed",))
-def test_mark_task_as_completed(browser, task_name):
+def test_mark_task_as_completed(page, task_name):
     """TC ID: TodoMVC-5 - Отметить задачу как 'выполненную'.
 
     Данный тест-кейс предназначен для проверки того, что
@@ -315,20 +304,20 @@ def test_mark_task_as_completed(browser, task_name):
     """
 
     # Добавляем задачу.
-    adding_task(task_name, browser)
+    adding_task(task_name, page)
 
     # Вытягиваем задачу.
-    task = get_current_tasks_from_todo_list(browser, get_one_task=True)
+    task = get_current_tasks_from_todo_list(page, get_one_task=True)
 
     # Нажимаем на кнопку отметки задачи как выполненной.
-    mark_task_as_completed(task, browser)
+    mark_task_as_completed(task, page)
 
     # Проверяем, что в списке есть выполненная задача.
-    assert get_completed_tasks_from_todo_list(browser, get_one_task=True)
+    assert get_completed_tasks_from_todo_list(page, get_one_task=True)
 
 
 @pytest.mark.parametrize("task_name", ("This task will be unmarked",))
-def test_unmark_task_as_completed(browser, task_name):
+def test_unmark_task_as_completed(page, task_name):
     """TC ID: TodoMVC-6 - Снять отметку с 'выполненной' задачи.
 
     Данный тест-кейс предназначен для проверки того, что
@@ -336,22 +325,22 @@ def test_unmark_task_as_completed(browser, task_name):
     """
 
     # Добавляем задачу.
-    adding_task(task_name, browser)
+    adding_task(task_name, page)
 
     # Получаем созданную задачу.
-    task = get_current_tasks_from_todo_list(browser, get_one_task=True)
+    task = get_current_tasks_from_todo_list(page, get_one_task=True)
 
     # Дважды нажимаем на кнопку отметки задачи как выполненной.
-    mark_task_as_completed(task, browser)
-    mark_task_as_completed(task, browser)
+    mark_task_as_completed(task, page)
+    mark_task_as_completed(task, page)
 
     # Проверяем, что в списке нет выполненных задач.
     with pytest.raises(NoSuchElementException):
-        browser.find_element_by_xpath("completed")
+        page.driver.find_element_by_xpath("completed")
 
 
 @pytest.mark.parametrize("task_names", (["Task 1", "Task 2"],))
-def test_check_list_after_refresh(browser, task_names):
+def test_check_list_after_refresh(page, task_names):
     """TC ID: TodoMVC-7 - Сохранение списка после обновления страницы
 
     Данный тест-кейс предназначен для проверки того, что
@@ -360,13 +349,13 @@ def test_check_list_after_refresh(browser, task_names):
     """
 
     # Добавляем задачи.
-    adding_task(task_names, browser)
+    adding_task(task_names, page)
 
     # Обновляем страницу.
-    browser.refresh()
+    page.reload_and_wait()
 
     # Находим список и проверяем, что он остался.
-    tasks = get_current_tasks_from_todo_list(browser)
+    tasks = get_current_tasks_from_todo_list(page)
     assert tasks != []
 
     # Проверяем, что длина сохранилась.
@@ -381,7 +370,7 @@ def test_check_list_after_refresh(browser, task_names):
 
 
 @pytest.mark.parametrize("old_task_name, new_task_name", (("Task before editing", "Task after editing"),))
-def test_edit_name_of_task(browser, old_task_name, new_task_name):
+def test_edit_name_of_task(page, old_task_name, new_task_name):
     """TC ID: TodoMVC-8 - Отредактировать название задачи.
 
     Данный тест-кейс предназначен для проверки того, что
@@ -390,23 +379,23 @@ def test_edit_name_of_task(browser, old_task_name, new_task_name):
     """
 
     # Добавляем задачу.
-    adding_task(old_task_name, browser)
+    adding_task(old_task_name, page)
 
     # Получаем созданную задачу.
-    task = get_current_tasks_from_todo_list(browser, get_one_task=True)
+    task = get_current_tasks_from_todo_list(page, get_one_task=True)
 
     # Редактируем название задачи.
-    edit_task_name(task, new_task_name, browser)
+    edit_task_name(task, new_task_name, page)
 
     # Снова получаем задачу и ее имя.
-    task = get_current_tasks_from_todo_list(browser, get_one_task=True)
+    task = get_current_tasks_from_todo_list(page, get_one_task=True)
 
     # Проверяем, что текущее название задачи соответствует новому.
     assert task.find_element_by_tag_name("label").text == new_task_name
 
 
 @pytest.mark.parametrize("task_for_deleting, task_for_saving", (("This must be deleted", "This must be saved"),))
-def test_delete_completed_tasks(browser, task_for_deleting, task_for_saving):
+def test_delete_completed_tasks(page, task_for_deleting, task_for_saving):
     """TC ID: TodoMVC-9 - Удалить все 'выполненные' задачи
 
     Данный тест-кейс предназначен для проверки того, что
@@ -419,10 +408,10 @@ def test_delete_completed_tasks(browser, task_for_deleting, task_for_saving):
     task_names = [task_for_deleting, task_for_saving]
 
     # Добавляем задачи.
-    adding_task(task_names, browser)
+    adding_task(task_names, page)
 
     # Получаем задачи.
-    tasks = get_current_tasks_from_todo_list(browser)
+    tasks = get_current_tasks_from_todo_list(page)
 
     for task in tasks:
 
@@ -430,14 +419,14 @@ def test_delete_completed_tasks(browser, task_for_deleting, task_for_saving):
 
         if label == task_for_deleting:
             # Помечаем задачу как 'решенную'.
-            mark_task_as_completed(task, browser)
+            mark_task_as_completed(task, page)
 
     # Удаляем все 'выполненные' задачи.
-    clear_completed_tasks(browser)
+    clear_completed_tasks(page)
 
     # Проверяем, что одна из задач осталась, а другая исчезла.
     is_task_saved = False
-    tasks = get_current_tasks_from_todo_list(browser)
+    tasks = get_current_tasks_from_todo_list(page)
     for task in tasks:
 
         label = task.find_element_by_tag_name("label").text
@@ -450,7 +439,7 @@ def test_delete_completed_tasks(browser, task_for_deleting, task_for_saving):
 
 
 @pytest.mark.parametrize("task_completed, task_active", (("This must not be shown", "This must be shown"),))
-def test_show_only_not_completed_tasks(browser, task_completed, task_active):
+def test_show_only_not_completed_tasks(page, task_completed, task_active):
     """TC ID: TodoMVC-10 - Показать только 'не выполненные' задачи.
 
     Данный тест-кейс предназначен для проверки того, что
@@ -463,10 +452,10 @@ def test_show_only_not_completed_tasks(browser, task_completed, task_active):
     task_names = [task_completed, task_active]
 
     # Добавляем задачи.
-    adding_task(task_names, browser)
+    adding_task(task_names, page)
 
     # Получаем задачи.
-    tasks = get_current_tasks_from_todo_list(browser)
+    tasks = get_current_tasks_from_todo_list(page)
 
     # Перебираем все задачи по очереди.
     for task in tasks:
@@ -475,13 +464,13 @@ def test_show_only_not_completed_tasks(browser, task_completed, task_active):
 
         if label == task_completed:
             # Помечаем задачу как 'решенную'.
-            mark_task_as_completed(task, browser)
+            mark_task_as_completed(task, page)
 
     # Обращаемся только к не завершенным задачам.
-    browser.get("http://todomvc.com/examples/react/#/active")
+    page.show_filter("active")
 
     # Проверяем, что одна из задач осталась, а другая исчезла.
-    tasks = get_current_tasks_from_todo_list(browser)
+    tasks = get_current_tasks_from_todo_list(page)
     is_task_saved = False
     for task in tasks:
 
@@ -495,7 +484,7 @@ def test_show_only_not_completed_tasks(browser, task_completed, task_active):
 
 
 @pytest.mark.parametrize("task_completed, task_active", (("This must be shown", "This must not be shown"),))
-def test_show_only_completed_tasks(browser, task_completed, task_active):
+def test_show_only_completed_tasks(page, task_completed, task_active):
     """TC ID: TodoMVC-11 - Показать только 'выполненные' задачи.
 
     Данный тест-кейс предназначен для проверки того, что
@@ -508,10 +497,10 @@ def test_show_only_completed_tasks(browser, task_completed, task_active):
     task_names = [task_completed, task_active]
 
     # Добавляем задачи.
-    adding_task(task_names, browser)
+    adding_task(task_names, page)
 
     # Получаем задачи.
-    tasks = get_current_tasks_from_todo_list(browser)
+    tasks = get_current_tasks_from_todo_list(page)
 
     # Перебираем все задачи по очереди.
     for task in tasks:
@@ -520,15 +509,15 @@ def test_show_only_completed_tasks(browser, task_completed, task_active):
 
         if label == task_completed:
             # Помечаем задачу как 'решенную'.
-            mark_task_as_completed(task, browser)
+            mark_task_as_completed(task, page)
 
-    # Обращаемся только к не завершенным задачам.
-    browser.get("http://todomvc.com/examples/react/#/completed")
+    # Обращаемся только к завершенным задачам.
+    page.show_filter("completed")
 
     # Проверяем, что одна из задач осталась, а другая исчезла.
     is_task_saved = False
 
-    tasks = get_current_tasks_from_todo_list(browser)
+    tasks = get_current_tasks_from_todo_list(page)
     for task in tasks:
 
         label = task.find_element_by_tag_name("label").text
@@ -541,7 +530,7 @@ def test_show_only_completed_tasks(browser, task_completed, task_active):
 
 
 @pytest.mark.parametrize("task_completed, task_active", (("This task is completed", "This task is active"),))
-def test_check_amount_of_active_tasks(browser, task_completed, task_active):
+def test_check_amount_of_active_tasks(page, task_completed, task_active):
     """TC ID: TodoMVC-12 - Проверить количество 'не выполненных задач'.
 
     Данный тест-кейс предназначен для проверки того, что
@@ -553,27 +542,27 @@ def test_check_amount_of_active_tasks(browser, task_completed, task_active):
     task_names = [task_completed, task_active]
 
     # Добавляем задачи.
-    adding_task(task_names, browser)
+    adding_task(task_names, page)
 
     # Находим число задач и проверяем их число.
-    assert check_number_of_active_tasks(browser) == 2
+    assert check_number_of_active_tasks(page) == 2
 
     # Получаем задачи.
-    tasks = get_current_tasks_from_todo_list(browser)
+    tasks = get_current_tasks_from_todo_list(page)
     for task in tasks:
 
         label = task.find_element_by_tag_name("label").text
 
         if label == task_completed:
             # Помечаем задачу как 'решенную'.
-            mark_task_as_completed(task, browser)
+            mark_task_as_completed(task, page)
 
     # Находим число задач и проверяем их число.
-    assert check_number_of_active_tasks(browser) == 1
+    assert check_number_of_active_tasks(page) == 1
 
 
 @pytest.mark.parametrize("task_names", (["Task 1", "Task 2"],))
-def test_mark_all_tasks_as_completed(browser, task_names):
+def test_mark_all_tasks_as_completed(page, task_names):
     """TC ID: TodoMVC-13 - Отметить все задачи как 'выполненные'.
 
     Данный тест-кейс предназначен для проверки того, что
@@ -582,14 +571,13 @@ def test_mark_all_tasks_as_completed(browser, task_names):
     """
 
     # Добавляем задачи.
-    adding_task(task_names, browser)
+    adding_task(task_names, page)
 
     # Находим кнопку для отметки всех задач как 'выполненные' и нажимаем её.
-    toggle_all = browser.find_element_by_class_name("toggle-all")
-    browser.execute_script("arguments[0].click();", toggle_all)
+    page.click_element("toggle_all")
 
     # Получаем все выполненные задачи.
-    completed_tasks = get_completed_tasks_from_todo_list(browser)
+    completed_tasks = get_completed_tasks_from_todo_list(page)
     assert completed_tasks is not None
 
     # Проверяем, что их число соответствует числу созданных.
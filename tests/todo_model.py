@@ -0,0 +1,125 @@
+# Адреса ссылок фильтров для каждого из режимов отображения.
+FILTERS = {
+    "all": "#/",
+    "active": "#/active",
+    "completed": "#/completed",
+}
+
+
+class TodoModel:
+    """Эталонная модель списка задач TodoMVC согласно спецификации
+    из папки docs. Используется для сверки с реальным состоянием
+    страницы во время случайного (model-based) тестирования.
+
+    Все операции, которые принимают индекс задачи, работают с индексом
+    в списке видимых задач (с учетом текущего фильтра), так же, как
+    пользователь работает с тем, что видит на странице. Если задачи с
+    таким индексом нет, то операция ничего не делает.
+    """
+
+    def __init__(self):
+        # Список задач в виде пар [название, выполнена ли задача].
+        self.todos = []
+        self.filter = "all"
+
+    def visible(self):
+        """Возвращает список задач, видимых при текущем фильтре."""
+
+        if self.filter == "active":
+            return [todo for todo in self.todos if not todo[1]]
+        if self.filter == "completed":
+            return [todo for todo in self.todos if todo[1]]
+        return list(self.todos)
+
+    def _visible_todo(self, index):
+        """Возвращает видимую задачу по индексу или None, если её нет."""
+
+        visible = self.visible()
+        if 0 <= index < len(visible):
+            return visible[index]
+        return None
+
+    def add(self, title):
+        """Добавляет задачу. Название обрезается по краям, пустые названия
+        игнорируются.
+        """
+
+        title = title.strip()
+        if title:
+            self.todos.append([title, False])
+
+    def edit(self, index, title):
+        """Изменяет название задачи. Если после обрезки название оказалось
+        пустым, то задача удаляется.
+        """
+
+        todo = self._visible_todo(index)
+        if todo is None:
+            return
+        title = title.strip()
+        if title:
+            todo[0] = title
+        else:
+            self.todos.remove(todo)
+
+    def toggle(self, index):
+        """Переключает отметку 'выполнена' у задачи."""
+
+        todo = self._visible_todo(index)
+        if todo is not None:
+            todo[1] = not todo[1]
+
+    def toggle_all(self):
+        """Если все задачи выполнены, то снимает со всех отметку,
+        иначе отмечает все задачи как выполненные.
+        """
+
+        if not self.todos:
+            return
+        completed = not all(todo[1] for todo in self.todos)
+        for todo in self.todos:
+            todo[1] = completed
+
+    def delete(self, index):
+        """Удаляет задачу."""
+
+        todo = self._visible_todo(index)
+        if todo is not None:
+            self.todos.remove(todo)
+
+    def clear_completed(self):
+        """Удаляет все выполненные задачи."""
+
+        self.todos = [todo for todo in self.todos if not todo[1]]
+
+    def set_filter(self, name):
+        """Переключает фильтр отображения задач."""
+
+        self.filter = name
+
+    def refresh(self):
+        """Обновление страницы. Список хранится в local storage, а фильтр -
+        в адресе страницы, поэтому состояние модели не меняется.
+        """
+
+    def apply(self, operation):
+        """Применяет операцию вида (имя, аргументы...) к модели."""
+
+        name, args = operation[0], operation[1:]
+        getattr(self, name)(*args)
+
+    def snapshot(self):
+        """Возвращает ожидаемое состояние страницы в том же формате, в
+        котором его возвращает снимок из браузера.
+        """
+
+        if not self.todos:
+            return {"todos": [], "count": None, "clear": False, "toggle_all": None, "filter": None}
+
+        return {
+            "todos": [list(todo) for todo in self.visible()],
+            "count": len([todo for todo in self.todos if not todo[1]]),
+            "clear": any(todo[1] for todo in self.todos),
+            "toggle_all": all(todo[1] for todo in self.todos),
+            "filter": FILTERS[self.filter],
+        }
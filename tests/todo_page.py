@@ -0,0 +1,243 @@
+from selenium.common.exceptions import StaleElementReferenceException
+from todo_model import FILTERS
+
+
+# JS-код, который устанавливает на странице MutationObserver и ведет
+# счетчик поколений DOM. Счетчик увеличивается только тогда, когда
+# меняется структура приложения вне списка задач (появляются или
+# исчезают 'main', 'footer', кнопка 'clear-completed' и т.д.).
+# Изменения внутри 'todo-list' и изменения текста счетчик не трогают,
+# так как сами закэшированные элементы от них не устаревают.
+#
+# Поколение возвращается в виде строки '<id страницы>:<номер>', чтобы
+# после перезагрузки страницы оно гарантированно отличалось от старого.
+INSTALL_OBSERVER_JS = """
+if (!window.__todoPage) {
+    var state = {id: Date.now() + '.' + Math.random(), generation: 0};
+
+    state.process = function (records) {
+        for (var i = 0; i < records.length; i++) {
+            var record = records[i];
+            var target = record.target;
+            // Изменения внутри списка задач не влияют на закэшированные элементы.
+            if (target.closest && target.closest('.todo-list')) {
+                continue;
+            }
+            var nodes = Array.prototype.concat.apply(
+                Array.prototype.slice.call(record.addedNodes),
+                Array.prototype.slice.call(record.removedNodes));
+            for (var j = 0; j < nodes.length; j++) {
+                if (nodes[j].nodeType === Node.ELEMENT_NODE) {
+                    state.generation++;
+                    return;
+                }
+            }
+        }
+    };
+
+    state.flush = function () {
+        state.process(state.observer.takeRecords());
+        return state.id + ':' + state.generation;
+    };
+
+    state.observer = new MutationObserver(state.process);
+    state.observer.observe(document.body, {childList: true, subtree: true});
+    window.__todoPage = state;
+}
+"""
+
+# Возвращает текущее поколение и, если оно не совпадает с переданным,
+# заново найденный элемент. Все делается за один вызов execute_script.
+RESOLVE_JS = INSTALL_OBSERVER_JS + """
+var generation = window.__todoPage.flush();
+if (generation === arguments[0]) {
+    return [generation, null];
+}
+return [generation, document.querySelector(arguments[1])];
+"""
+
+# Нажимает на элемент и сразу возвращает новое поколение DOM, чтобы
+# после клика не приходилось отдельно проверять состояние страницы.
+CLICK_JS = INSTALL_OBSERVER_JS + """
+arguments[0].click();
+return window.__todoPage.flush();
+"""
+
+# Переключает фильтр без перезагрузки страницы: нажимает на ссылку
+# фильтра в footer'е, а если footer'а нет (список пуст), то меняет
+# только адрес после '#'. Затем ждет, пока роутер отметит нужную
+# ссылку как выбранную и кадр будет отрисован, и возвращает новое
+# поколение DOM.
+SHOW_FILTER_JS = INSTALL_OBSERVER_JS + """
+var hash = arguments[0];
+var done = arguments[arguments.length - 1];
+var link = document.querySelector('.filters a[href="' + hash + '"]');
+if (link) {
+    link.click();
+} else if (window.location.hash !== hash) {
+    window.location.hash = hash;
+}
+(function wait() {
+    var selected = document.querySelector('.filters a.selected');
+    var rendered = !document.querySelector('.filters') ||
+        (selected !== null && selected.getAttribute('href') === hash);
+    if (window.location.hash === hash && rendered) {
+        requestAnimationFrame(function () { done(window.__todoPage.flush()); });
+    } else {
+        setTimeout(wait, 0);
+    }
+})();
+"""
+
+# Ждет, пока приложение отрисуется после загрузки страницы.
+WAIT_FOR_APP_JS = """
+var done = arguments[arguments.length - 1];
+(function wait() {
+    if (document.readyState === 'complete' && document.querySelector('.new-todo')) {
+        done();
+    } else {
+        setTimeout(wait, 0);
+    }
+})();
+"""
+
+
+class TodoPage:
+    """Объект страницы TodoMVC, который кэширует найденные элементы.
+
+    Каждый элемент запоминается вместе с поколением DOM, в котором он
+    был найден. Элемент ищется заново только тогда, когда структура
+    приложения действительно изменилась, либо когда Selenium сообщил,
+    что ссылка на элемент устарела.
+    """
+
+    # CSS-селекторы элементов, которые можно кэшировать.
+    SELECTORS = {
+        "new_todo": ".new-todo",
+        "toggle_all": ".toggle-all",
+        "todo_list": ".todo-list",
+        "footer": ".footer",
+        "todo_count": ".todo-count",
+        "clear_completed": ".clear-completed",
+    }
+
+    def __init__(self, driver):
+        """:param driver: Объект браузера."""
+
+        self.driver = driver
+        # Закэшированные элементы: имя -> (поколение, элемент).
+        self._cache = {}
+        # Последнее известное поколение DOM. None означает, что
+        # после последнего действия состояние страницы неизвестно.
+        self._generation = None
+
+    def invalidate(self):
+        """Сбрасывает кэш элементов. Нужно вызывать после переходов
+        по страницам и перезагрузок, которые делаются в обход объекта.
+        """
+
+        self._cache.clear()
+        self._generation = None
+
+    def show_filter(self, name):
+        """Переключает фильтр отображения задач без перезагрузки страницы
+        и ждет, пока список будет перерисован.
+
+        :param name: Имя фильтра: 'all', 'active' или 'completed'.
+        """
+
+        self._generation = self.driver.execute_async_script(SHOW_FILTER_JS, FILTERS[name])
+
+    def reload_and_wait(self):
+        """Обновляет страницу, сбрасывает кэш элементов и ждет,
+        пока приложение снова отрисуется.
+        """
+
+        self.driver.refresh()
+        self.invalidate()
+        self.driver.execute_async_script(WAIT_FOR_APP_JS)
+
+    def element(self, name):
+        """Возвращает элемент по его имени из SELECTORS.
+
+        Если поколение DOM известно и совпадает с поколением, в котором
+        элемент был найден, то браузеру не отправляется ни одной команды.
+
+        :param name: Имя элемента.
+        :return Объект элемента.
+        """
+
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == self._generation:
+            return cached[1]
+
+        cached_generation = cached[0] if cached is not None else None
+        generation, element = self.driver.execute_script(RESOLVE_JS, cached_generation, self.SELECTORS[name])
+        self._generation = generation
+
+        if element is None:
+            if cached is not None and cached_generation == generation:
+                # Структура не менялась, поэтому старый элемент все еще актуален.
+                return cached[1]
+            # Элемента пока нет на странице. Ищем его обычным способом, чтобы
+            # сработало неявное ожидание, либо вылетело NoSuchElementException.
+            # Пока шло ожидание, структура страницы поменялась, поэтому такой
+            # элемент не кэшируется.
+            self._generation = None
+            return self.driver.find_element_by_css_selector(self.SELECTORS[name])
+
+        self._cache[name] = (generation, element)
+        return element
+
+    def call(self, name, action):
+        """Выполняет действие над элементом, централизованно обрабатывая
+        устаревшие ссылки: при StaleElementReferenceException кэш
+        сбрасывается, элемент ищется заново и действие повторяется один раз.
+
+        :param name: Имя элемента.
+        :param action: Функция, принимающая объект элемента.
+        :return Результат функции action.
+        """
+
+        try:
+            return action(self.element(name))
+        except StaleElementReferenceException:
+            self.invalidate()
+            return action(self.element(name))
+
+    def click(self, element):
+        """Нажимает на элемент с помощью JS и обновляет известное поколение DOM.
+
+        :param element: Объект элемента.
+        """
+
+        self._generation = self.driver.execute_script(CLICK_JS, element)
+
+    def click_element(self, name):
+        """Нажимает на закэшированный элемент по его имени.
+
+        :param name: Имя элемента.
+        """
+
+        self.call(name, self.click)
+
+    def send_keys(self, name, *keys):
+        """Вводит текст в закэшированный элемент по его имени. После ввода
+        состояние страницы считается неизвестным, так как, например,
+        нажатие Enter может добавить в приложение новые элементы.
+        Само поле ввода от этого не устаревает, поэтому оно остается
+        в кэше, и повторный ввод в него не требует поиска элемента.
+
+        :param name: Имя элемента.
+        :param keys: Вводимые строки и клавиши.
+        """
+
+        def type_keys(element):
+            element.send_keys(*keys)
+            return element
+
+        element = self.call(name, type_keys)
+        self._generation = None
+        # Поле запоминается с неизвестным поколением: пока поколение
+        # остается неизвестным, оно берется из кэша без проверки.
+        self._cache[name] = (None, element)